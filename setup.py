@@ -37,6 +37,7 @@ setup(
         "requests>=2.31.0",
         "plotly>=5.17.0",
         "numpy>=1.24.0",
+        "pandas>=2.0.0",
         "scipy>=1.11.0",
         "fpdf>=1.7.2",
         "skyfield>=1.45",
@@ -53,6 +54,10 @@ setup(
         "pdf": [
             "kaleido>=0.2.1",  # For PDF chart export
         ],
+        "perf": [
+            "numba>=0.57",  # JIT-compiled haversine kernels
+            "orjson>=3.9",  # SIMD-accelerated JSON load/save
+        ],
     },
     entry_points={
         "console_scripts": [
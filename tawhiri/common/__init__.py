@@ -2,9 +2,12 @@
 Common Utilities
 
 Shared functionality used across TAWHIRI modules including
-logging setup and file operations.
+logging setup, file operations, and the shared constants and
+TLE/time/math helpers from tawhiri.common.common.
 """
 
+from .common import *  # noqa: F401,F403
+from .common import __all__ as _common_all
 from .logging_setup import setup_logging
 from .file_utils import safe_read_file, safe_write_file, ensure_directory
 
@@ -13,4 +16,5 @@ __all__ = [
     "safe_read_file",
     "safe_write_file",
     "ensure_directory",
+    *_common_all,
 ]
@@ -0,0 +1,55 @@
+"""
+Numba-Compiled Haversine Kernels
+
+Optional JIT-compiled haversine implementations for hot scalar loops
+(per-timestep ground-track and visibility calculations) where NumPy
+batching is not possible.
+
+This module imports numba unconditionally; callers should try-import it
+and fall back to the pure-Python implementation in common.py when numba
+is not installed.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def haversine_distance_jit(
+    lat1: float, lon1: float,
+    lat2: float, lon2: float,
+    radius: float
+) -> float:
+    """
+    JIT-compiled great circle distance between two points (degrees in,
+    same units as radius out). Mirrors common.haversine_distance.
+    """
+    lat1_rad = math.radians(lat1)
+    lon1_rad = math.radians(lon1)
+    lat2_rad = math.radians(lat2)
+    lon2_rad = math.radians(lon2)
+
+    dlat = lat2_rad - lat1_rad
+    dlon = lon2_rad - lon1_rad
+
+    a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
+    c = 2 * math.asin(math.sqrt(a))
+
+    return radius * c
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def haversine_distance_jit_batch(lat1, lon1, lat2, lon2, radius):
+    """
+    Parallel JIT-compiled distance for equal-length 1-D arrays.
+
+    All four coordinate arrays must have the same length; use
+    common.haversine_distance_batch for broadcasting semantics.
+    """
+    n = lat1.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = haversine_distance_jit(lat1[i], lon1[i], lat2[i], lon2[i], radius)
+    return out
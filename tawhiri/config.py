@@ -5,14 +5,78 @@ Loads configuration from config.json with fallbacks to sensible defaults.
 Supports environment-specific overrides for development, production, and secure deployments.
 """
 
+import copy
+import functools
 import json
 import os
 import pathlib
+import threading
 from typing import Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Optional SIMD-accelerated JSON parser (same pattern as tawhiri.common)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Path.home() does a pwd database lookup; resolve it once at import.
+# Defaults are kept as a plain-string template so load_config only pays
+# for one deep copy instead of ~9 Path constructions per call.
+_HOME = str(pathlib.Path.home())
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "data_dir": f"{_HOME}/tawhiri_data",
+    "space_weather": {
+        "noaa_api_key": "",
+        "bom_api_key": "",
+        "cache_ttl_seconds": 600,
+        "update_interval_minutes": 10,
+    },
+    "orbit_viz": {
+        "earth_textures_dir": f"{_HOME}/tawhiri_data/earth",
+        "tle_file": f"{_HOME}/tawhiri_data/tle-single.txt",
+        "sat_metadata": f"{_HOME}/tawhiri_data/3d/sat_metadata.csv",
+        "preferences_dir": f"{_HOME}/tawhiri_data/3d",
+        "skyfield_cache": f"{_HOME}/tawhiri_data/skyfield_cache",
+    },
+    "logging": {
+        "log_file": f"{_HOME}/tawhiri_data/logs/tawhiri.log",
+        "log_level": "INFO",
+        "log_to_console": True,
+        "log_format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    },
+    "deployment": {
+        "environment": "development",
+        "offline_mode": False,
+        "high_contrast_mode": False,
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _getenv(name: str) -> Optional[str]:
+    """Cached environment lookup for vars that are constant per-process."""
+    return os.environ.get(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _exists_fast(path: str) -> bool:
+    """
+    Cached existence check via a single stat.
+
+    os.path.isfile stats on every call — a round trip per candidate on
+    the networked filesystems Tawhiri deploys to. Config discovery is
+    one-shot per process, so caching the result is safe.
+    """
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -34,72 +98,48 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         /opt/tawhiri/data
     """
     
-    # Default configuration
-    home = pathlib.Path.home()
-    default_config = {
-        "data_dir": str(home / "tawhiri_data"),
-        "space_weather": {
-            "noaa_api_key": "",
-            "bom_api_key": "",
-            "cache_ttl_seconds": 600,
-            "update_interval_minutes": 10,
-        },
-        "orbit_viz": {
-            "earth_textures_dir": str(home / "tawhiri_data" / "earth"),
-            "tle_file": str(home / "tawhiri_data" / "tle-single.txt"),
-            "sat_metadata": str(home / "tawhiri_data" / "3d" / "sat_metadata.csv"),
-            "preferences_dir": str(home / "tawhiri_data" / "3d"),
-            "skyfield_cache": str(home / "tawhiri_data" / "skyfield_cache"),
-        },
-        "logging": {
-            "log_file": str(home / "tawhiri_data" / "logs" / "tawhiri.log"),
-            "log_level": "INFO",
-            "log_to_console": True,
-            "log_format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        },
-        "deployment": {
-            "environment": "development",
-            "offline_mode": False,
-            "high_contrast_mode": False,
-        },
-    }
-    
-    # Search for config file
+    # Bind os.environ to a local: env.get reads the mapping directly,
+    # skipping the os.getenv wrapper call on each lookup
+    env = os.environ
+
+    # Default configuration (precomputed template, see module top)
+    default_config = copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+
+    # Search for config file (stops at the first candidate that exists)
     if config_path is None:
-        search_paths = [
-            os.getenv("TAWHIRI_CONFIG"),
-            "./config.json",
-            str(home / ".tawhiri" / "config.json"),
-            "/etc/tawhiri/config.json",
-        ]
-        
-        for path in search_paths:
-            if path and os.path.isfile(path):
-                config_path = path
-                break
-    
+        config_path = next(
+            (p for p in (
+                _getenv("TAWHIRI_CONFIG"),
+                "./config.json",
+                f"{_HOME}/.tawhiri/config.json",
+                "/etc/tawhiri/config.json",
+            ) if p and _exists_fast(p)),
+            None,
+        )
+
     # Load user configuration if found
     if config_path and os.path.isfile(config_path):
         try:
-            with open(config_path, 'r') as f:
-                user_config = json.load(f)
-            
+            with open(config_path, 'rb') as f:
+                user_config = _loads(f.read())
+
             # Deep merge with defaults
             _deep_merge(default_config, user_config)
-            logger.info(f"Loaded configuration from: {config_path}")
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in config file {config_path}: {e}")
+            logger.info("Loaded configuration from: %s", config_path)
+
+        except ValueError as e:
+            logger.error("Invalid JSON in config file %s: %s", config_path, e)
         except Exception as e:
-            logger.error(f"Error loading config file {config_path}: {e}")
+            logger.error("Error loading config file %s: %s", config_path, e)
     else:
         logger.warning("No config file found, using defaults")
     
     # Environment variable overrides
-    if os.getenv("TAWHIRI_DATA_DIR"):
-        default_config["data_dir"] = os.getenv("TAWHIRI_DATA_DIR")
-    
-    if os.getenv("TAWHIRI_OFFLINE"):
+    data_dir = env.get("TAWHIRI_DATA_DIR")
+    if data_dir:
+        default_config["data_dir"] = data_dir
+
+    if env.get("TAWHIRI_OFFLINE"):
         default_config["deployment"]["offline_mode"] = True
     
     return default_config
@@ -108,16 +148,24 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
 def _deep_merge(base: Dict, updates: Dict) -> None:
     """
     Deep merge updates into base dictionary (in-place).
-    
+
+    Iterative with an explicit stack rather than recursive: each Python
+    frame costs far more than a list append, and config trees are built
+    from plain dicts so the exact type(x) is dict check suffices.
+
     Args:
         base: Base dictionary to update
         updates: Dictionary with updates to apply
     """
-    for key, value in updates.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            _deep_merge(base[key], value)
-        else:
-            base[key] = value
+    stack = [(base, updates)]
+    while stack:
+        b, u = stack.pop()
+        for key, value in u.items():
+            bv = b.get(key)
+            if type(bv) is dict and type(value) is dict:
+                stack.append((bv, value))
+            else:
+                b[key] = value
 
 
 def get_data_path(config: Dict[str, Any], *parts: str) -> pathlib.Path:
@@ -135,8 +183,14 @@ def get_data_path(config: Dict[str, Any], *parts: str) -> pathlib.Path:
         >>> config = load_config()
         >>> tle_path = get_data_path(config, "tle-single.txt")
     """
-    base = pathlib.Path(config["data_dir"])
-    return base.joinpath(*parts)
+    return _joined_data_path(config["data_dir"], parts)
+
+
+@functools.lru_cache(maxsize=512)
+def _joined_data_path(base: str, parts: tuple) -> pathlib.Path:
+    # Keyed on the data_dir string so the cache stays correct across
+    # config reloads; Path objects are immutable so sharing is safe.
+    return pathlib.Path(base).joinpath(*parts)
 
 
 def ensure_directories(config: Dict[str, Any]) -> None:
@@ -153,27 +207,52 @@ def ensure_directories(config: Dict[str, Any]) -> None:
         config["orbit_viz"]["skyfield_cache"],
         os.path.dirname(config["logging"]["log_file"]),
     ]
-    
+
+    # Most targets share data_dir as a prefix, and makedirs(exist_ok=True)
+    # stats every component of every path. Collect the unique ancestors
+    # once and issue a single mkdir per directory, parents first.
+    to_make = set()
     for dir_path in dirs_to_create:
+        path = os.path.abspath(dir_path)
+        while path not in to_make:
+            to_make.add(path)
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+
+    # Guard the per-directory debug formatting; this runs in a loop
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    for dir_path in sorted(to_make, key=len):
         try:
-            os.makedirs(dir_path, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {dir_path}")
+            os.mkdir(dir_path)
+            if debug_enabled:
+                logger.debug("Created directory: %s", dir_path)
+        except FileExistsError:
+            pass
         except Exception as e:
-            logger.error(f"Failed to create directory {dir_path}: {e}")
+            logger.error("Failed to create directory %s: %s", dir_path, e)
 
 
 # Global config instance (lazy loaded)
 _global_config: Optional[Dict[str, Any]] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Dict[str, Any]:
     """
     Get global configuration instance (lazy loaded).
-    
+
+    Thread-safe: under Streamlit's threaded request model two first-access
+    threads could otherwise both run load_config(), duplicating file I/O
+    and JSON parsing. Double-checked locking keeps the warm path lock-free.
+
     Returns:
         Configuration dictionary
     """
     global _global_config
     if _global_config is None:
-        _global_config = load_config()
+        with _config_lock:
+            if _global_config is None:
+                _global_config = load_config()
     return _global_config
@@ -11,6 +11,13 @@ Example:
     >>> run()
 """
 
-from .app import run
-
 __all__ = ["run"]
+
+
+def __getattr__(name):
+    # PEP 562 lazy import: app.py pulls in streamlit, so defer it until
+    # run is actually requested rather than on package import.
+    if name == "run":
+        from .app import run
+        return run
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
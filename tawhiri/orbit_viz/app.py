@@ -7,11 +7,18 @@ This is where you'll migrate your existing globe_sidebar_module.py run() functio
 
 import streamlit as st
 import logging
+import threading
 from tawhiri.config import get_config
 from tawhiri.common import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# Logging handlers are process-global, so track setup at module scope
+# rather than per-session in st.session_state (whose __contains__ takes
+# a lock on every rerun, and which resets while handlers persist).
+_LOGGING_SETUP = False
+_LOGGING_LOCK = threading.Lock()
+
 
 def run(set_page_config: bool = True):
     """
@@ -27,15 +34,18 @@ def run(set_page_config: bool = True):
     # Load configuration
     config = get_config()
     
-    # Setup logging
-    if 'logging_configured' not in st.session_state:
-        setup_logging(
-            log_file=config['logging']['log_file'],
-            log_level=config['logging']['log_level'],
-            log_to_console=config['logging']['log_to_console'],
-        )
-        st.session_state.logging_configured = True
-        logger.info("Orbit Visualization module started")
+    # Setup logging (double-checked: lock-free once configured)
+    global _LOGGING_SETUP
+    if not _LOGGING_SETUP:
+        with _LOGGING_LOCK:
+            if not _LOGGING_SETUP:
+                setup_logging(
+                    log_file=config['logging']['log_file'],
+                    log_level=config['logging']['log_level'],
+                    log_to_console=config['logging']['log_to_console'],
+                )
+                _LOGGING_SETUP = True
+                logger.info("Orbit Visualization module started")
     
     # Page config
     if set_page_config:
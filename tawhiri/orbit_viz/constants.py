@@ -6,6 +6,8 @@ Physical constants, defaults, and configuration for orbit visualization.
 
 import pathlib
 
+import numpy as np
+
 # ========== Physical Constants ==========
 
 EARTH_RADIUS_KM = 6371.0           # WGS84 mean radius
@@ -48,6 +50,24 @@ COLORBLIND_SAFE_COLORS = {
     'HIGHLIGHT': '#F0E442',  # Yellow
 }
 
+# Preparsed RGB palettes, structure-of-arrays: plotting code resolves a
+# category color with DEFAULT_COLORS_RGB[CATEGORY_INDEX[cat]] — one array
+# index instead of a dict lookup plus per-trace hex parsing.
+
+
+def _hex_palette_to_rgb(palette: dict) -> np.ndarray:
+    return np.array(
+        [[int(h[1:3], 16), int(h[3:5], 16), int(h[5:7], 16)]
+         for h in palette.values()],
+        dtype=np.uint8,
+    )
+
+
+_COLOR_KEYS = tuple(DEFAULT_COLORS)
+CATEGORY_INDEX = {key: i for i, key in enumerate(_COLOR_KEYS)}
+DEFAULT_COLORS_RGB = _hex_palette_to_rgb(DEFAULT_COLORS)
+COLORBLIND_SAFE_COLORS_RGB = _hex_palette_to_rgb(COLORBLIND_SAFE_COLORS)
+
 # ========== Feature Flags ==========
 
 FEATURE_CATEGORY_COLORS = True     # Use category-based colors from metadata
@@ -6,11 +6,15 @@ Plotly-based 2D ground track visualization with footprints and GEO boxes.
 TODO: Migrate your plot_ground_2d() and animate_groundtrack_2d() functions here.
 """
 
-import plotly.graph_objects as go
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Import plotly inside each plotting function, not at module level:
+# plotly.graph_objects alone costs hundreds of milliseconds and ~15 MB,
+# and callers that never plot should not pay for it.
+#     import plotly.graph_objects as go
+
 # TODO: Move 2D plotting functions from your monolithic file here:
 # - plot_ground_2d()
 # - animate_groundtrack_2d()
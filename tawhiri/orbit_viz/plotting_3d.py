@@ -6,11 +6,15 @@ Plotly-based 3D visualization of satellite orbits in ECI/ECEF frames.
 TODO: Migrate your plot_orbits() function here.
 """
 
-import plotly.graph_objects as go
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Import plotly inside each plotting function, not at module level:
+# plotly.graph_objects alone costs hundreds of milliseconds and ~15 MB,
+# and callers that never plot should not pay for it.
+#     import plotly.graph_objects as go
+
 # TODO: Move 3D plotting functions from your monolithic file here:
 # - plot_orbits()
 # - Helper functions for 3D visualization
@@ -30,4 +30,14 @@ __all__ = [
     'S_SCALE_THRESHOLDS',
     'G_SCALE_THRESHOLDS',
     'SEVERITY_COLORS',
-]
\ No newline at end of file
+    'run',
+]
+
+
+def __getattr__(name):
+    # PEP 562 lazy import: app.py pulls in streamlit and plotly, so
+    # defer it until run is actually requested.
+    if name == "run":
+        from .app import run
+        return run
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
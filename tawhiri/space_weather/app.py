@@ -14,30 +14,33 @@ Or import into larger dashboard:
 
 import streamlit as st
 from streamlit.components.v1 import html
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import tempfile
-import base64
-import os
+import io
 
 # Import our modular components
-from .constants import SEVERITY_COLORS, NOAA_URLS
+from .constants import SEVERITY_COLORS, SCALE_LEVEL
 from .scales import r_scale, s_scale, g_scale, g_scale_from_kp
 from .data_fetchers import (
-    get_noaa_rsg_now_and_past,
-    get_3day_summary,
-    get_next24_summary,
+    get_dashboard_bundle,
     make_summary,
-    fetch_json,
-    fetch_text
 )
-from .plotting import create_xray_chart, create_proton_chart, create_kp_chart
-from .pdf_export import create_space_weather_pdf, save_chart_for_pdf
+# .plotting (plotly) and .pdf_export (reportlab/kaleido) are imported
+# lazily inside their tabs so dashboard startup skips those imports
+# until the user actually opens the Charts or PDF Export tab.
 from .nz_translations import rewrite_to_nz, _r_class, _s_class, _g_class
 from .utils import last_updated
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Optional: script-rerun based auto-refresh (pip install streamlit-autorefresh)
+try:
+    from streamlit_autorefresh import st_autorefresh
+    AUTOREFRESH_AVAILABLE = True
+except ImportError:
+    AUTOREFRESH_AVAILABLE = False
+
 
 def run(set_page_config: bool = False):
     """
@@ -68,10 +71,15 @@ def run(set_page_config: bool = False):
         refresh_min = st.slider("Auto-refresh (minutes)", 0, 30, 10)
         if refresh_min > 0:
             interval_ms = int(refresh_min * 60 * 1000)
-            html(
-                f"<script>setTimeout(function(){{ window.location.reload(); }}, {interval_ms});</script>",
-                height=0
-            )
+            if AUTOREFRESH_AVAILABLE:
+                # Reruns the script server-side: cached data stays warm,
+                # no full browser reload / WebSocket teardown
+                st_autorefresh(interval=interval_ms, key="sw_autorefresh")
+            else:
+                html(
+                    f"<script>setTimeout(function(){{ window.location.reload(); }}, {interval_ms});</script>",
+                    height=0
+                )
         
         # Display settings
         high_contrast = st.toggle("High-contrast mode", True)
@@ -87,27 +95,21 @@ def run(set_page_config: bool = False):
     apply_styles(_font_scale, _high_contrast)
     
     # ========== Fetch Data ==========
-    with st.spinner("Loading space weather data..."):
-        # Current and past conditions
-        past, current = get_noaa_rsg_now_and_past()
-        
-        # 3-day forecast
-        forecast_3day = get_3day_summary()
-        day1 = forecast_3day['days'][0] if forecast_3day['days'] else {}
-        day2 = forecast_3day['days'][1] if len(forecast_3day['days']) > 1 else {}
-        day3 = forecast_3day['days'][2] if len(forecast_3day['days']) > 2 else {}
-        
-        # Next 24h summary
-        next24 = get_next24_summary()
-        
-        # Executive summary
-        summary_text = make_summary(current, next24)
-        
-        # BOM Aurora data (optional)
-        bom_aurora_text = fetch_text("https://www.sws.bom.gov.au/HF_Systems/6/3")
-        
-        # NOAA Discussion
-        noaa_discussion_raw = fetch_text(NOAA_URLS['discussion'])
+    # Single cached bundle: one cache probe per rerun, all feeds fetched
+    # concurrently on a miss (spinner comes from the cache decorator)
+    bundle = get_dashboard_bundle("https://www.sws.bom.gov.au/HF_Systems/6/3")
+    past, current = bundle.past, bundle.current
+    forecast_3day = bundle.forecast_3day
+    next24 = bundle.next24
+    bom_aurora = bundle.bom_aurora  # (preview, full text)
+    noaa_discussion_raw = bundle.discussion
+
+    day1 = forecast_3day['days'][0] if forecast_3day['days'] else {}
+    day2 = forecast_3day['days'][1] if len(forecast_3day['days']) > 1 else {}
+    day3 = forecast_3day['days'][2] if len(forecast_3day['days']) > 2 else {}
+
+    # Executive summary
+    summary_text = make_summary(current, next24)
     
     # ========== Tab Structure ==========
     tabs = st.tabs([
@@ -139,7 +141,7 @@ def run(set_page_config: bool = False):
     
     # ========== Aurora Tab ==========
     with tabs[4]:
-        render_aurora_tab(bom_aurora_text, current)
+        render_aurora_tab(bom_aurora, current)
     
     # ========== Expert Data Tab ==========
     with tabs[5]:
@@ -149,7 +151,7 @@ def run(set_page_config: bool = False):
     with tabs[6]:
         render_pdf_export_tab(
             current, past, day1, summary_text,
-            noaa_discussion_raw, bom_aurora_text
+            noaa_discussion_raw, bom_aurora[1]
         )
     
     # ========== Help & Info Tab ==========
@@ -162,13 +164,23 @@ def run(set_page_config: bool = False):
 
 def apply_styles(font_scale: float, high_contrast: bool):
     """Apply global CSS styles to the dashboard."""
+    # The CSS string build is cached per (font_scale, high_contrast);
+    # emitting the identical string each rerun lets Streamlit's element
+    # diff skip resending it. (The markdown call itself cannot be
+    # skipped — elements not re-emitted are removed from the page.)
+    st.markdown(_build_css(font_scale, high_contrast), unsafe_allow_html=True)
+
+
+@st.cache_data
+def _build_css(font_scale: float, high_contrast: bool) -> str:
+    """Render the dashboard CSS block for the given display settings."""
     neon = "#00ffff" if high_contrast else "#8be9fd"
     fg = "#ffffff" if high_contrast else "#dbe7ff"
     bg = "#0a0a0a" if high_contrast else "#0d1419"
     card = "#0f0f0f" if high_contrast else "#111a21"
     border = "#ffffff90" if high_contrast else "rgba(139,233,253,.25)"
-    
-    st.markdown(f"""
+
+    return f"""
     <style>
     :root {{
       --scale: {font_scale};
@@ -190,7 +202,26 @@ def apply_styles(font_scale: float, high_contrast: bool):
     .watch {{ background:#e67e22; color:#0b0b0b; }}
     .severe {{ background:#e74c3c; color:#0b0b0b; }}
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+# Status-pill markup for every valid scale code, built once at import.
+# The overview tab re-renders on every widget interaction, so the pills
+# become dict lookups instead of per-rerun classify + format work.
+_PILL_CLASS_FN = {"R": _r_class, "S": _s_class, "G": _g_class}
+PILL_HTML = {
+    code: f'<div class="rs-pill {_PILL_CLASS_FN[code[0]](code)}">{code}</div>'
+    for code in (f"{kind}{i}" for kind in "RSG" for i in range(6))
+}
+
+
+def _pill(code: str, kind: str) -> str:
+    """Return pill markup for a scale code, tolerating malformed input."""
+    html_snippet = PILL_HTML.get(code)
+    if html_snippet is None:
+        cls = _PILL_CLASS_FN[kind](code)
+        html_snippet = f'<div class="rs-pill {cls}">{code}</div>'
+    return html_snippet
 
 
 def render_overview_tab(current: dict, past: dict, next24: dict, summary: str):
@@ -205,22 +236,19 @@ def render_overview_tab(current: dict, past: dict, next24: dict, summary: str):
     with col1:
         st.markdown("#### R - Radio Blackouts")
         r_value = current.get('r', 'R0')
-        r_class = _r_class(r_value)
-        st.markdown(f'<div class="rs-pill {r_class}">{r_value}</div>', unsafe_allow_html=True)
+        st.markdown(_pill(r_value, 'R'), unsafe_allow_html=True)
         st.caption("Solar X-ray flares affecting HF radio")
     
     with col2:
         st.markdown("#### S - Radiation Storms")
         s_value = current.get('s', 'S0')
-        s_class = _s_class(s_value)
-        st.markdown(f'<div class="rs-pill {s_class}">{s_value}</div>', unsafe_allow_html=True)
+        st.markdown(_pill(s_value, 'S'), unsafe_allow_html=True)
         st.caption("Solar energetic particles")
     
     with col3:
         st.markdown("#### G - Geomagnetic Storms")
         g_value = current.get('g', 'G0')
-        g_class = _g_class(g_value)
-        st.markdown(f'<div class="rs-pill {g_class}">{g_value}</div>', unsafe_allow_html=True)
+        st.markdown(_pill(g_value, 'G'), unsafe_allow_html=True)
         st.caption("Disturbances in Earth's magnetic field")
     
     # Executive Summary
@@ -287,11 +315,13 @@ def render_operations_impact_tab(current: dict, next24: dict, day1: dict):
 
 def render_charts_tab():
     """Render the Charts tab with live space weather data."""
+    from .plotting import cached_xray_chart, cached_proton_chart, cached_kp_chart
+
     st.markdown("## Real-Time Space Weather Charts")
     
     # X-ray Flux
     st.markdown("### X-ray Flux (6-hour)")
-    xray_fig = create_xray_chart()
+    xray_fig = cached_xray_chart()
     if xray_fig:
         st.plotly_chart(xray_fig, use_container_width=True)
     else:
@@ -299,7 +329,7 @@ def render_charts_tab():
     
     # Proton Flux
     st.markdown("### Proton Flux (24-hour)")
-    proton_fig = create_proton_chart()
+    proton_fig = cached_proton_chart()
     if proton_fig:
         st.plotly_chart(proton_fig, use_container_width=True)
     else:
@@ -307,7 +337,7 @@ def render_charts_tab():
     
     # Kp Index
     st.markdown("### Kp Index (Geomagnetic Activity)")
-    kp_fig = create_kp_chart()
+    kp_fig = cached_kp_chart()
     if kp_fig:
         st.plotly_chart(kp_fig, use_container_width=True)
     else:
@@ -349,24 +379,24 @@ def render_forecasts_tab(day1: dict, day2: dict, day3: dict):
                     st.markdown(f"- G-scale: {g_label} ({g_severity})")
 
 
-def render_aurora_tab(bom_text: str, current: dict):
+def render_aurora_tab(bom_aurora: tuple, current: dict):
     """Render the Aurora tab with BOM data and visibility predictions."""
     st.markdown("## Aurora Forecast (BOM)")
-    
-    if bom_text:
+
+    preview, full_text = bom_aurora
+    if full_text:
         st.markdown("### Australian Bureau of Meteorology Outlook")
-        st.text(bom_text[:500])  # First 500 chars
-        
+        st.text(preview)  # First 500 chars, sliced once at fetch time
+
         with st.expander("Full BOM Aurora Forecast"):
-            st.text(bom_text)
+            st.text(full_text)
     else:
         st.warning("BOM aurora data unavailable")
     
     # NZ-specific aurora guidance
     st.markdown("### Aurora Visibility for New Zealand")
     
-    g_now = current.get('g', 'G0')
-    g_level = int(g_now[1]) if len(g_now) > 1 and g_now[1].isdigit() else 0
+    g_level = SCALE_LEVEL.get(current.get('g', 'G0'), 0)
     
     if g_level >= 4:
         st.success("🌌 Strong aurora likely visible in South Island and possibly lower North Island!")
@@ -409,6 +439,9 @@ def render_pdf_export_tab(
     aurora: str
 ):
     """Render the PDF Export tab."""
+    from .pdf_export import create_space_weather_pdf, chart_png_bytes
+    from .plotting import cached_xray_chart, cached_proton_chart, cached_kp_chart
+
     st.markdown("## Export Management PDF Report")
     
     st.info("Generate a professional PDF report for briefings and operational planning.")
@@ -420,70 +453,56 @@ def render_pdf_export_tab(
     if st.button("Generate PDF Report"):
         with st.spinner("Creating PDF..."):
             try:
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                    # Prepare chart paths if requested
-                    chart_paths = {}
-                    if include_charts:
-                        with tempfile.TemporaryDirectory() as tmpdir:
-                            # Generate and save charts
-                            xray_fig = create_xray_chart()
-                            if xray_fig:
-                                path = f"{tmpdir}/xray.png"
-                                if save_chart_for_pdf(xray_fig, path):
-                                    chart_paths["X-ray Flux"] = path
-                            
-                            proton_fig = create_proton_chart()
-                            if proton_fig:
-                                path = f"{tmpdir}/proton.png"
-                                if save_chart_for_pdf(proton_fig, path):
-                                    chart_paths["Proton Flux"] = path
-                            
-                            kp_fig = create_kp_chart()
-                            if kp_fig:
-                                path = f"{tmpdir}/kp.png"
-                                if save_chart_for_pdf(kp_fig, path):
-                                    chart_paths["Kp Index"] = path
-                    
-                    # Create PDF
-                    success = create_space_weather_pdf(
-                        output_path=tmp.name,
-                        current_conditions=current,
-                        past_conditions=past,
-                        forecast_24h=day1,
-                        summary_text=summary,
-                        discussion_text=discussion if include_discussion else None,
-                        aurora_text=aurora,
-                        chart_paths=chart_paths if chart_paths else None,
-                        organization="NZDF Space Weather Service",
-                        include_charts=include_charts,
-                        include_discussion=include_discussion
+                # Render charts to PNG bytes in memory if requested.
+                # The three kaleido renders are independent and release
+                # the GIL during the render IPC, so run them in parallel.
+                chart_paths = {}
+                if include_charts:
+                    # Same cached figures the Charts tab renders — if the
+                    # user has viewed that tab this refresh cycle, these
+                    # are cache hits rather than fresh fetch + build work
+                    figs = [
+                        ("X-ray Flux", cached_xray_chart()),
+                        ("Proton Flux", cached_proton_chart()),
+                        ("Kp Index", cached_kp_chart()),
+                    ]
+                    with ThreadPoolExecutor(max_workers=3) as executor:
+                        pngs = executor.map(chart_png_bytes, (fig for _, fig in figs))
+                    for (chart_name, _), png in zip(figs, pngs):
+                        if png:
+                            chart_paths[chart_name] = png
+
+                # Build the PDF straight into memory — no temp file
+                # round-trip before handing bytes to the download button
+                buf = io.BytesIO()
+                success = create_space_weather_pdf(
+                    output_path=buf,
+                    current_conditions=current,
+                    past_conditions=past,
+                    forecast_24h=day1,
+                    summary_text=summary,
+                    discussion_text=discussion if include_discussion else None,
+                    aurora_text=aurora,
+                    chart_paths=chart_paths if chart_paths else None,
+                    organization="NZDF Space Weather Service",
+                    include_charts=include_charts,
+                    include_discussion=include_discussion
+                )
+
+                if success:
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+                    filename = f"space_weather_report_{timestamp}.pdf"
+
+                    st.download_button(
+                        label="📄 Download PDF Report",
+                        data=buf.getvalue(),
+                        file_name=filename,
+                        mime="application/pdf"
                     )
-                    
-                    if success:
-                        # Read PDF and offer download
-                        with open(tmp.name, "rb") as f:
-                            pdf_bytes = f.read()
-                        
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-                        filename = f"space_weather_report_{timestamp}.pdf"
-                        
-                        st.download_button(
-                            label="📄 Download PDF Report",
-                            data=pdf_bytes,
-                            file_name=filename,
-                            mime="application/pdf"
-                        )
-                        st.success("✅ PDF generated successfully!")
-                    else:
-                        st.error("❌ PDF generation failed. Check that reportlab is installed.")
-                
-                # Clean up temp file
-                try:
-                    os.unlink(tmp.name)
-                except:
-                    pass
-                    
+                    st.success("✅ PDF generated successfully!")
+                else:
+                    st.error("❌ PDF generation failed. Check that reportlab is installed.")
+
             except Exception as e:
                 st.error(f"Error generating PDF: {e}")
                 logger.error(f"PDF generation error: {e}")
@@ -43,6 +43,10 @@ SEVERITY_LABELS = {
     'R0': 'quiet',   'S0': 'quiet',   'G0': 'quiet',
 }
 
+# Scale code -> numeric level (e.g. "G3" -> 3), for O(1) dispatch in the
+# UI instead of per-rerun string parsing
+SCALE_LEVEL = {f"{kind}{i}": i for kind in "RSG" for i in range(6)}
+
 # ========== NOAA API Endpoints ==========
 
 NOAA_URLS = {
@@ -100,6 +104,12 @@ EARTH_RADIUS_KM = 6371.0
 # Cache time-to-live in seconds (default: 10 minutes)
 DEFAULT_CACHE_TTL = 600
 
+# Tiered TTLs: NOAA endpoints update on very different cadences, so the
+# fast-moving feeds (1-minute Kp, GOES flux) get a short window while
+# the forecast discussion text (issued a few times daily) keeps longer.
+CACHE_TTL_FAST = 60
+CACHE_TTL_SLOW = 1800
+
 # ========== User Agent ==========
 
 USER_AGENT = "TAWHIRI-SpaceWeather/1.0 (NZDF)"
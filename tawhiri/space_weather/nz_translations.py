@@ -13,12 +13,123 @@ Functions:
     - Helper functions for severity classification and risk assessment
 """
 
+import functools
+import re
 from typing import Optional
 
 
 # Regional hint for NZ context
 _NZ_REGIONAL_HINT = " "
 
+# Precomputed scale-code -> CSS-class tables. The inputs come from a
+# 6-element domain (R0..R5 etc.), so severity classification is a single
+# dict lookup instead of a chain of startswith tests per rerun.
+_CSS_BY_LEVEL_RS = ("ok", "caution", "caution", "watch", "severe", "severe")
+_CSS_BY_LEVEL_G = ("ok", "ok", "caution", "watch", "severe", "severe")
+_R_CSS_CLASS = {f"R{i}": _CSS_BY_LEVEL_RS[i] for i in range(6)}
+_S_CSS_CLASS = {f"S{i}": _CSS_BY_LEVEL_RS[i] for i in range(6)}
+_G_CSS_CLASS = {f"G{i}": _CSS_BY_LEVEL_G[i] for i in range(6)}
+
+# Section keyword classifiers: one named-group alternation per section,
+# compiled once. A single sweep collects every keyword category present
+# in the text; severity order is then decided by _SECTION_PRIORITY so a
+# "major" phrase still outranks a "moderate" one appearing earlier.
+# Unknown sections use the "particles" classifier.
+_SECTION_RX = {
+    "solar_activity": re.compile(
+        r"(?P<major>x-class|major flare|significant flare)"
+        r"|(?P<mod>m-class|moderate)"
+        r"|(?P<low>c-class|low|quiet)",
+        re.I,
+    ),
+    "solar_wind": re.compile(
+        r"(?P<cme>cme|shock|sheath)"
+        r"|(?P<fast>high speed|coronal hole|600 km/s|elevated)",
+        re.I,
+    ),
+    "geospace": re.compile(
+        r"(?P<storm>g2|g3|storm)|(?P<active>active|unsettled)",
+        re.I,
+    ),
+    "particles": re.compile(r"(?P<high>elevated|enhanced|storm)", re.I),
+}
+
+_SECTION_PRIORITY = {
+    "solar_activity": ("major", "mod", "low"),
+    "solar_wind": ("cme", "fast"),
+    "geospace": ("storm", "active"),
+    "particles": ("high",),
+}
+
+# Base sentence per section and matched category; None is the fallback
+# when no keyword category was found.
+_SECTION_BASE = {
+    "solar_activity": {
+        "major": "Major solar flares noted — higher chance of radio/GNSS issues across New Zealand.",
+        "mod": "Moderate solar flares observed — brief HF/GNSS hiccups possible over NZ.",
+        "low": "The Sun is fairly quiet — only small flares, negligible impact for NZ.",
+        None: "Solar activity is mixed but not unusual for the cycle; NZ impacts limited.",
+    },
+    "solar_wind": {
+        "cme": "A CME is influencing the solar wind — conditions can stir up NZ geomagnetic activity.",
+        "fast": "Solar wind is running fast — may unsettle Earth's field; aurora possible in the far south.",
+        None: "Solar wind conditions are near normal — minimal impact expected over NZ.",
+    },
+    "geospace": {
+        "storm": "Geomagnetic storming occurred — GNSS accuracy could dip; aurora chances improve in Southland.",
+        "active": "Field was unsettled — small GNSS wobbles possible; low aurora chance.",
+        None: "Geomagnetic field is quiet for NZ — comms and GNSS are stable.",
+    },
+    "particles": {
+        "high": "Energetic particles elevated — low operational impact for NZ; monitor polar routes.",
+        None: "Radiation environment looks normal for NZ operations.",
+    },
+}
+
+
+def _classify_section(section: str, tx: str) -> str:
+    """
+    Pick the base sentence for a section with one scan of the text.
+
+    Args:
+        section: Section name; unknown sections use the particles rules
+        tx: Stripped source text
+
+    Returns:
+        The base sentence for the highest-priority keyword category
+        found, or the section's fallback sentence
+    """
+    key = section if section in _SECTION_RX else "particles"
+    hits = {m.lastgroup for m in _SECTION_RX[key].finditer(tx)}
+    bases = _SECTION_BASE[key]
+    for group in _SECTION_PRIORITY[key]:
+        if group in hits:
+            return bases[group]
+    return bases[None]
+
+# NZ operational risk phrases, kind x level, built once at import so
+# _nz_risk_phrase is a pure double lookup.
+_NZ_RISK = {
+    "R": {
+        "ok": "HF comms across NZ should be fine.",
+        "caution": "Short HF dropouts are possible, mainly sunlit side; most NZ circuits OK.",
+        "watch": "Heightened risk of HF and GNSS disruption across NZ, esp. midday paths.",
+        "severe": "Significant HF and GNSS disruption likely across NZ and the Pacific."
+    },
+    "S": {
+        "ok": "Radiation environment normal over NZ.",
+        "caution": "Elevated radiation — minor impacts; commercial flights OK, polar routes more affected.",
+        "watch": "High radiation risk for polar operations; monitor aviation/space assets in our region.",
+        "severe": "Severe radiation storm — restrict high-latitude ops; protect space assets."
+    },
+    "G": {
+        "ok": "Geomagnetic field quiet; GNSS is stable across NZ.",
+        "caution": "Field unsettled — small GNSS accuracy dips possible; slim aurora chance in Southland.",
+        "watch": "Storm conditions — GNSS accuracy can degrade at times; good aurora odds in the deep south.",
+        "severe": "Severe storm — GNSS, HF, and power systems may be impacted; widespread aurora possible."
+    },
+}
+
 
 def _any(txt: str, *phrases) -> bool:
     """
@@ -57,16 +168,7 @@ def _r_class(r: str) -> str:
         >>> _r_class("R5")
         'severe'
     """
-    r = (r or "").upper()
-    if r.startswith("R0"):
-        return "ok"
-    if r.startswith("R1") or r.startswith("R2"):
-        return "caution"
-    if r.startswith("R3"):
-        return "watch"
-    if r.startswith(("R4", "R5")):
-        return "severe"
-    return "ok"  # Default to ok for unknown
+    return _R_CSS_CLASS.get((r or "").upper()[:2], "ok")
 
 
 def _s_class(s: str) -> str:
@@ -85,16 +187,7 @@ def _s_class(s: str) -> str:
         >>> _s_class("S4")
         'severe'
     """
-    s = (s or "").upper()
-    if s.startswith("S0"):
-        return "ok"
-    if s.startswith("S1") or s.startswith("S2"):
-        return "caution"
-    if s.startswith("S3"):
-        return "watch"
-    if s.startswith(("S4", "S5")):
-        return "severe"
-    return "ok"  # Default to ok for unknown
+    return _S_CSS_CLASS.get((s or "").upper()[:2], "ok")
 
 
 def _g_class(g: str) -> str:
@@ -113,16 +206,7 @@ def _g_class(g: str) -> str:
         >>> _g_class("G3")
         'watch'
     """
-    g = (g or "").upper()
-    if g.startswith("G0") or g.startswith("G1"):
-        return "ok"
-    if g.startswith("G2"):
-        return "caution"
-    if g.startswith("G3"):
-        return "watch"
-    if g.startswith(("G4", "G5")):
-        return "severe"
-    return "ok"  # Default to ok for unknown
+    return _G_CSS_CLASS.get((g or "").upper()[:2], "ok")
 
 
 def _class_to_level(cls_key: str) -> str:
@@ -165,33 +249,23 @@ def _nz_risk_phrase(kind: str, level: str) -> str:
         >>> _nz_risk_phrase("G", "severe")
         'Severe storm — GNSS, HF, and power systems may be impacted; widespread aurora possible.'
     """
-    if kind == "R":
-        # Radio blackout risks for NZ
-        return {
-            "ok": "HF comms across NZ should be fine.",
-            "caution": "Short HF dropouts are possible, mainly sunlit side; most NZ circuits OK.",
-            "watch": "Heightened risk of HF and GNSS disruption across NZ, esp. midday paths.",
-            "severe": "Significant HF and GNSS disruption likely across NZ and the Pacific."
-        }[level]
-    
-    if kind == "S":
-        # Solar radiation storm risks for NZ
-        return {
-            "ok": "Radiation environment normal over NZ.",
-            "caution": "Elevated radiation — minor impacts; commercial flights OK, polar routes more affected.",
-            "watch": "High radiation risk for polar operations; monitor aviation/space assets in our region.",
-            "severe": "Severe radiation storm — restrict high-latitude ops; protect space assets."
-        }[level]
-    
-    # Geomagnetic storm risks for NZ (G-scale)
-    return {
-        "ok": "Geomagnetic field quiet; GNSS is stable across NZ.",
-        "caution": "Field unsettled — small GNSS accuracy dips possible; slim aurora chance in Southland.",
-        "watch": "Storm conditions — GNSS accuracy can degrade at times; good aurora odds in the deep south.",
-        "severe": "Severe storm — GNSS, HF, and power systems may be impacted; widespread aurora possible."
-    }[level]
+    # Unknown kinds fall back to the G-scale table, matching the old
+    # if/elif/else ordering
+    return _NZ_RISK.get(kind, _NZ_RISK["G"])[level]
+
 
+# Section -> (scale kind, code classifier, index into (r, s, g)).
+# One dict lookup replaces the if/elif ladder that dispatched the risk
+# phrase; sections without a scale (e.g. particles) fall through to the
+# base sentence alone.
+_SECTION_RISK = {
+    "solar_activity": ("R", _r_class, 0),
+    "solar_wind": ("S", _s_class, 1),
+    "geospace": ("G", _g_class, 2),
+}
 
+
+@functools.lru_cache(maxsize=128)
 def rewrite_to_nz(
     section: str,
     text: str,
@@ -203,9 +277,13 @@ def rewrite_to_nz(
 ) -> str:
     """
     Rewrite technical NOAA space weather text into NZ-specific operational language.
-    
+
     Takes technical space weather descriptions and converts them into plain English
     with NZ-relevant operational impacts suitable for NZDF briefings.
+
+    Memoized: the inputs are drawn from a tiny domain (section names x
+    R0..R5 etc.), so widget-driven reruns reuse the rendered markdown
+    instead of re-templating it.
     
     Args:
         section: Section type ("solar_activity", "solar_wind", "geospace", or other)
@@ -231,64 +309,20 @@ def rewrite_to_nz(
     if not tx:
         base = "No significant activity reported."
     else:
-        low = tx.lower()
-        
-        if section == "solar_activity":
-            # Solar flare activity translation
-            if _any(low, "x-class", "major flare", "significant flare"):
-                base = "Major solar flares noted — higher chance of radio/GNSS issues across New Zealand."
-            elif _any(low, "m-class", "moderate"):
-                base = "Moderate solar flares observed — brief HF/GNSS hiccups possible over NZ."
-            elif _any(low, "c-class", "low", "quiet"):
-                base = "The Sun is fairly quiet — only small flares, negligible impact for NZ."
-            else:
-                base = "Solar activity is mixed but not unusual for the cycle; NZ impacts limited."
-        
-        elif section == "solar_wind":
-            # Solar wind conditions translation
-            if _any(low, "cme", "shock", "sheath"):
-                base = "A CME is influencing the solar wind — conditions can stir up NZ geomagnetic activity."
-            elif _any(low, "high speed", "coronal hole", "600 km/s", "elevated"):
-                base = "Solar wind is running fast — may unsettle Earth's field; aurora possible in the far south."
-            else:
-                base = "Solar wind conditions are near normal — minimal impact expected over NZ."
-        
-        elif section == "geospace":
-            # Geomagnetic field conditions translation
-            if _any(low, "g2", "g3", "storm"):
-                base = "Geomagnetic storming occurred — GNSS accuracy could dip; aurora chances improve in Southland."
-            elif _any(low, "active", "unsettled"):
-                base = "Field was unsettled — small GNSS wobbles possible; low aurora chance."
-            else:
-                base = "Geomagnetic field is quiet for NZ — comms and GNSS are stable."
-        
-        else:
-            # Energetic particles and other sections
-            if _any(low, "elevated", "enhanced", "storm"):
-                base = "Energetic particles elevated — low operational impact for NZ; monitor polar routes."
-            else:
-                base = "Radiation environment looks normal for NZ operations."
-    
-    # Add appropriate risk phrase based on section type
-    if section == "solar_activity":
-        r_cls = _r_class(r_now)
-        main_risk = _nz_risk_phrase("R", _class_to_level(r_cls))
-        return f"{base}{_NZ_REGIONAL_HINT}\n• {main_risk}"
+        base = _classify_section(section, tx)
     
-    elif section == "solar_wind":
-        s_cls = _s_class(s_now)
-        main_risk = _nz_risk_phrase("S", _class_to_level(s_cls))
-        return f"{base}{_NZ_REGIONAL_HINT}\n• {main_risk}"
-    
-    elif section == "geospace":
-        g_cls = _g_class(g_now)
-        main_risk = _nz_risk_phrase("G", _class_to_level(g_cls))
-        return f"{base}{_NZ_REGIONAL_HINT}\n• {main_risk}"
-    
-    else:
+    # Add appropriate risk phrase via the dispatch table. The _*_class
+    # lookups already yield canonical level keys, so no extra
+    # normalization hop is needed.
+    entry = _SECTION_RISK.get(section)
+    if entry is None:
         # Fallback for other sections - just return base text with regional hint
         return f"{base}{_NZ_REGIONAL_HINT}"
 
+    kind, cls_fn, idx = entry
+    main_risk = _nz_risk_phrase(kind, cls_fn((r_now, s_now, g_now)[idx]))
+    return f"{base}{_NZ_REGIONAL_HINT}\n• {main_risk}"
+
 
 # Module exports
 __all__ = [
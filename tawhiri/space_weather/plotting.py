@@ -11,13 +11,22 @@ Functions:
     - create_timeseries_chart: Generic configurable time series chart
 """
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 from plotly.graph_objs import Figure
+import streamlit as st
 
 from .data_fetchers import fetch_json
 from .utils import clamp_float
-from .constants import SEVERITY_COLORS
+from .constants import SEVERITY_COLORS, DEFAULT_CACHE_TTL
+
+# NOAA feed endpoints shared by the chart factories and the coalesced
+# frame loader below.
+XRAY_URL = "https://services.swpc.noaa.gov/json/goes/primary/xrays-6-hour.json"
+PROTON_URL = "https://services.swpc.noaa.gov/json/goes/primary/integral-protons-1-day.json"
+KP_URL = "https://services.swpc.noaa.gov/json/planetary_k_index_1m.json"
 
 
 # Default chart styling
@@ -66,30 +75,37 @@ def create_timeseries_chart(
         >>> fig = create_timeseries_chart(data, title="X-ray Flux")
         >>> fig.show()
     """
-    if not data:
-        return None
-        
-    # Extract times and values
-    times = [row.get(time_field) for row in data if time_field in row]
-    values = [row.get(value_field, 0) for row in data]
-    
-    if not times or not values:
-        return None
-    
-    # Create figure
-    fig = go.Figure()
-    
-    # Add trace
-    fig.add_trace(
-        go.Scatter(
-            x=times,
-            y=values,
-            mode="lines",
-            name=trace_name,
-            line=dict(color=color)
-        )
-    )
+    if isinstance(data, pd.DataFrame):
+        # Pre-typed frame from load_timeseries_frames(): columns are
+        # already datetime64/float64, so hand the arrays straight over
+        if data.empty:
+            return None
+        times = data["time"].to_numpy()
+        values = data["value"].to_numpy()
+    else:
+        if not data:
+            return None
+
+        # Extract times and values
+        times = [row.get(time_field) for row in data if time_field in row]
+        values = [row.get(value_field, 0) for row in data]
+
+        if not times or not values:
+            return None
     
+    # Assemble the trace as a plain dict: go.Scatter plus add_trace
+    # route every property through plotly's validation layer, which
+    # dominates construction time for figures this small. The dict is
+    # wrapped into a Figure once at the boundary instead.
+    trace = {
+        "type": "scatter",
+        "x": times,
+        "y": values,
+        "mode": "lines",
+        "name": trace_name,
+        "line": {"color": color},
+    }
+
     # Base layout
     layout_config = {
         "title": title,
@@ -110,16 +126,15 @@ def create_timeseries_chart(
     
     # Merge with custom layout kwargs
     layout_config.update(layout_kwargs)
-    
-    fig.update_layout(**layout_config)
-    
-    return fig
+
+    return go.Figure({"data": [trace], "layout": layout_config})
 
 
 def create_xray_chart(
-    url: str = "https://services.swpc.noaa.gov/json/goes/primary/xrays-6-hour.json",
+    url: str = XRAY_URL,
     title: str = "X-rays (6-hour)",
     height: int = 220,
+    frame: Optional[pd.DataFrame] = None,
     **kwargs
 ) -> Optional[Figure]:
     """
@@ -142,10 +157,13 @@ def create_xray_chart(
         >>> if fig:
         ...     fig.show()
     """
-    data = fetch_json(url)
-    if not data:
-        return None
-        
+    if frame is not None:
+        data = frame
+    else:
+        data = fetch_json(url)
+        if not data:
+            return None
+
     return create_timeseries_chart(
         data=data,
         time_field="time_tag",
@@ -161,9 +179,10 @@ def create_xray_chart(
 
 
 def create_proton_chart(
-    url: str = "https://services.swpc.noaa.gov/json/goes/primary/integral-protons-1-day.json",
+    url: str = PROTON_URL,
     title: str = "Integral Protons (1-day)",
     height: int = 220,
+    frame: Optional[pd.DataFrame] = None,
     **kwargs
 ) -> Optional[Figure]:
     """
@@ -186,10 +205,13 @@ def create_proton_chart(
         >>> if fig:
         ...     fig.show()
     """
-    data = fetch_json(url)
-    if not data:
-        return None
-        
+    if frame is not None:
+        data = frame
+    else:
+        data = fetch_json(url)
+        if not data:
+            return None
+
     return create_timeseries_chart(
         data=data,
         time_field="time_tag",
@@ -205,9 +227,10 @@ def create_proton_chart(
 
 
 def create_kp_chart(
-    url: str = "https://services.swpc.noaa.gov/json/planetary_k_index_1m.json",
+    url: str = KP_URL,
     title: str = "Kp Index (1-minute)",
     height: int = 220,
+    frame: Optional[pd.DataFrame] = None,
     **kwargs
 ) -> Optional[Figure]:
     """
@@ -230,57 +253,149 @@ def create_kp_chart(
         >>> if fig:
         ...     fig.show()
     """
-    kp_data = fetch_json(url)
-    if not kp_data:
-        return None
-    
-    # Extract times and clamped Kp values
-    times = [row.get("time_tag") for row in kp_data if "time_tag" in row]
-    kp_values = [clamp_float(row.get("kp_index", 0)) for row in kp_data]
+    if frame is not None:
+        if frame.empty:
+            return None
+        times = frame["time"].to_numpy()
+        kp_values = frame["value"].to_numpy()
+    else:
+        kp_data = fetch_json(url)
+        if not kp_data:
+            return None
+
+        # Extract times and clamped Kp values
+        times = [row.get("time_tag") for row in kp_data if "time_tag" in row]
+        kp_values = [clamp_float(row.get("kp_index", 0)) for row in kp_data]
+
+        if not times or not kp_values:
+            return None
     
-    if not times or not kp_values:
+    # Raw-dict assembly, as in create_timeseries_chart; the figure is
+    # wrapped once at the end instead of mutated through validated
+    # add_trace/add_hline/update_layout calls
+    trace = {
+        "type": "scatter",
+        "x": times,
+        "y": kp_values,
+        "mode": "lines",
+        "name": "Kp Index",
+        "line": {"color": SEVERITY_COLORS.get("G3", "#ffc800")},
+    }
+
+    layout_config = {
+        "title": title,
+        "height": height,
+        "margin": DEFAULT_CHART_CONFIG["margin"],
+        "xaxis": {"title": "Time", "color": DEFAULT_CHART_CONFIG["xaxis_color"]},
+        "yaxis": {
+            "title": "Kp Index",
+            "color": DEFAULT_CHART_CONFIG["yaxis_color"],
+            "range": [0, 9],  # Kp always 0-9
+        },
+        "plot_bgcolor": DEFAULT_CHART_CONFIG["plot_bgcolor"],
+        "paper_bgcolor": DEFAULT_CHART_CONFIG["paper_bgcolor"],
+        # Storm threshold at Kp=5 as a static shape + annotation;
+        # add_hline re-validates the whole figure on insertion
+        "shapes": [{
+            "type": "line",
+            "xref": "paper",
+            "x0": 0, "x1": 1,
+            "y0": 5, "y1": 5,
+            "line": {"dash": "dash", "color": "red"},
+        }],
+        "annotations": [{
+            "xref": "paper", "yref": "y",
+            "x": 1, "y": 5,
+            "xanchor": "right", "yanchor": "bottom",
+            "text": "Storm Threshold (Kp≥5)",
+            "showarrow": False,
+        }],
+    }
+    layout_config.update(kwargs)
+
+    return go.Figure({"data": [trace], "layout": layout_config})
+
+
+def _frame_from_feed(
+    data: Optional[List[Dict[str, Any]]],
+    value_field: str
+) -> Optional[pd.DataFrame]:
+    """
+    Convert a raw NOAA JSON feed into a pre-typed two-column DataFrame.
+
+    Args:
+        data: Parsed feed rows (list of dicts), or None on fetch failure
+        value_field: Key holding the numeric series (e.g., "flux")
+
+    Returns:
+        DataFrame with a datetime64 "time" column and float64 "value"
+        column, or None if the feed is missing or malformed
+    """
+    if not data:
         return None
-    
-    # Create figure manually to allow for custom Kp-specific features
-    fig = go.Figure()
-    
-    # Add Kp trace
-    fig.add_trace(
-        go.Scatter(
-            x=times,
-            y=kp_values,
-            mode="lines",
-            name="Kp Index",
-            line=dict(color=SEVERITY_COLORS.get("G3", "#ffc800"))
-        )
-    )
-    
-    # Add horizontal line at Kp=5 (storm threshold)
-    fig.add_hline(
-        y=5,
-        line_dash="dash",
-        line_color="red",
-        annotation_text="Storm Threshold (Kp≥5)",
-        annotation_position="right"
-    )
-    
-    # Layout
-    fig.update_layout(
-        title=title,
-        height=height,
-        margin=DEFAULT_CHART_CONFIG["margin"],
-        xaxis=dict(title="Time", color=DEFAULT_CHART_CONFIG["xaxis_color"]),
-        yaxis=dict(
-            title="Kp Index",
-            color=DEFAULT_CHART_CONFIG["yaxis_color"],
-            range=[0, 9]  # Kp always 0-9
-        ),
-        plot_bgcolor=DEFAULT_CHART_CONFIG["plot_bgcolor"],
-        paper_bgcolor=DEFAULT_CHART_CONFIG["paper_bgcolor"],
-        **kwargs
+    raw = pd.DataFrame(data)
+    if "time_tag" not in raw.columns or value_field not in raw.columns:
+        return None
+    return pd.DataFrame({
+        "time": pd.to_datetime(raw["time_tag"], errors="coerce"),
+        # errors="coerce" + fillna mirrors clamp_float's default of 0.0,
+        # but vectorised over the whole column
+        "value": pd.to_numeric(raw[value_field], errors="coerce")
+                   .fillna(0.0).astype(np.float64),
+    })
+
+
+@st.cache_data(ttl=DEFAULT_CACHE_TTL)
+def load_timeseries_frames() -> Tuple[
+    Optional[pd.DataFrame], Optional[pd.DataFrame], Optional[pd.DataFrame]
+]:
+    """
+    Fetch and type-convert the three NOAA chart feeds once per TTL window.
+
+    The per-point JSON-to-float conversion over thousands of rows happens
+    here, vectorised, instead of in each chart factory on every rerun.
+
+    Returns:
+        (xray, proton, kp) DataFrames from _frame_from_feed; individual
+        entries are None when that feed is unavailable
+    """
+    return (
+        _frame_from_feed(fetch_json(XRAY_URL), "flux"),
+        _frame_from_feed(fetch_json(PROTON_URL), "flux"),
+        _frame_from_feed(fetch_json(KP_URL), "kp_index"),
     )
-    
-    return fig
+
+
+# Cached variants: figure construction is pure given the (cached) feed
+# data, so widget-driven reruns can reuse the built Figure instead of
+# re-fetching and reassembling it. The PDF export path shares these
+# entries, so "view charts then export" builds each figure once.
+
+@st.cache_data(ttl=DEFAULT_CACHE_TTL)
+def cached_xray_chart() -> Optional[Figure]:
+    """Cached create_xray_chart() for rerun-heavy UI paths."""
+    xray, _, _ = load_timeseries_frames()
+    if xray is None:
+        return None
+    return create_xray_chart(frame=xray)
+
+
+@st.cache_data(ttl=DEFAULT_CACHE_TTL)
+def cached_proton_chart() -> Optional[Figure]:
+    """Cached create_proton_chart() for rerun-heavy UI paths."""
+    _, proton, _ = load_timeseries_frames()
+    if proton is None:
+        return None
+    return create_proton_chart(frame=proton)
+
+
+@st.cache_data(ttl=DEFAULT_CACHE_TTL)
+def cached_kp_chart() -> Optional[Figure]:
+    """Cached create_kp_chart() for rerun-heavy UI paths."""
+    _, _, kp = load_timeseries_frames()
+    if kp is None:
+        return None
+    return create_kp_chart(frame=kp)
 
 
 def create_multi_threshold_chart(
@@ -351,6 +466,10 @@ __all__ = [
     "create_xray_chart",
     "create_proton_chart",
     "create_kp_chart",
+    "cached_xray_chart",
+    "cached_proton_chart",
+    "cached_kp_chart",
+    "load_timeseries_frames",
     "create_timeseries_chart",
     "create_multi_threshold_chart",
     "DEFAULT_CHART_CONFIG",
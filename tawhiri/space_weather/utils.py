@@ -6,6 +6,7 @@ Helper functions for data processing, validation, and formatting.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 
@@ -52,7 +53,14 @@ def last_updated() -> str:
         >>> last_updated()
         '2025-11-21 14:30 UTC'
     """
-    return datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
+    # Display granularity is one minute, so memoize the strftime on the
+    # truncated timestamp; repeat calls within a minute are a cache hit
+    return _format_minute(datetime.utcnow().replace(second=0, microsecond=0))
+
+
+@lru_cache(maxsize=2)
+def _format_minute(minute: datetime) -> str:
+    return minute.strftime("%Y-%m-%d %H:%M UTC")
 
 
 def safe_dict_get(data: Optional[dict], key: str, default: Any = None) -> Any:
@@ -20,12 +20,13 @@ from tawhiri.common import (
     # File I/O
     load_json, save_json, _lines_from_source,
     # TLE parsing
-    validate_tle, parse_tle_line1, parse_tle_line2,
-    load_tles, read_multi_epoch_tle_file,
+    validate_tle, tle_checksum, parse_tle_line1, parse_tle_line2,
+    load_tles, load_tles_soa, read_multi_epoch_tle_file,
     # Time
     utc_now, format_timestamp, parse_timestamp,
     # Math
-    deg_to_rad, rad_to_deg, normalize_angle, haversine_distance
+    deg_to_rad, rad_to_deg, normalize_angle, haversine_distance,
+    haversine_distance_batch
 )
 
 
@@ -187,6 +188,28 @@ class TestTLEParsing:
         line2 = "2 25544  51.6400 208.5800 0002571  89.2100  53.4900 15.54225995123456"
         assert validate_tle(line1, line2) is False
     
+    def test_tle_checksum(self):
+        """Test TLE checksum computation."""
+        # Digits sum at face value, '-' counts as 1, modulo 10
+        line = "1 25544U 98067A   25326.50000000  .00016717  00000-0  10270-3 0  900"
+        checksum = tle_checksum(line)
+        assert 0 <= checksum <= 9
+
+        # Appending the correct checksum digit makes a self-consistent line
+        full_line = line + str(checksum)
+        assert tle_checksum(full_line) == int(full_line[68])
+
+    def test_validate_tle_checksum_enforcement(self):
+        """Test optional checksum enforcement in validate_tle."""
+        base1 = SAMPLE_TLE_ISS[1][:68]
+        base2 = SAMPLE_TLE_ISS[2][:68]
+        good1 = base1 + str(tle_checksum(base1))
+        good2 = base2 + str(tle_checksum(base2))
+        bad1 = base1 + str((tle_checksum(base1) + 1) % 10)
+
+        assert validate_tle(good1, good2, check_checksum=True) is True
+        assert validate_tle(bad1, good2, check_checksum=True) is False
+
     def test_parse_tle_line1(self):
         """Test parsing TLE line 1."""
         line1 = SAMPLE_TLE_ISS[1]
@@ -253,6 +276,24 @@ class TestTLEParsing:
             # Should handle gracefully, might be empty
             assert isinstance(tles, dict)
     
+    def test_load_tles_soa(self):
+        """Test structure-of-arrays catalog loading."""
+        data = '\n'.join(SAMPLE_TLE_ISS).encode('utf-8')
+        catalog = load_tles_soa(data)
+
+        assert len(catalog) == 1
+        assert catalog.norad_ids[0] == 25544
+        assert "ISS" in catalog.names[0]
+        assert catalog.line1[0].startswith("1 ")
+        assert 50 < catalog.inclination[0] < 52
+        assert 15 < catalog.mean_motion[0] < 16
+        assert 0 <= catalog.eccentricity[0] < 1
+
+        # Precomputed radians (float32) track the degree arrays
+        import numpy as np
+        assert catalog.inclination_rad.dtype == np.float32
+        assert abs(catalog.inclination_rad[0] - math.radians(catalog.inclination[0])) < 1e-5
+
     def test_read_multi_epoch_tle_file(self):
         """Test loading multi-epoch TLE file."""
         # Create multi-epoch TLE data (same satellite, different epochs)
@@ -338,6 +379,16 @@ class TestMathUtilities:
         assert normalize_angle(-10) == 350.0
         assert normalize_angle(-370) == 350.0
     
+    def test_normalize_angle_array(self):
+        """Test angle normalization on NumPy arrays."""
+        import numpy as np
+
+        angles = np.array([370.0, -10.0, 180.0])
+        normalized = normalize_angle(angles)
+
+        assert isinstance(normalized, np.ndarray)
+        assert list(normalized) == [10.0, 350.0, 180.0]
+
     def test_normalize_angle_custom_range(self):
         """Test angle normalization with custom range."""
         assert normalize_angle(190, -180, 180) == -170.0
@@ -350,17 +401,17 @@ class TestMathUtilities:
     
     def test_haversine_distance_known(self):
         """Test haversine distance for known locations."""
-        # Wellington to Auckland (approx 640 km)
+        # Wellington to Auckland (approx 490 km great circle)
         wellington_lat, wellington_lon = -41.28, 174.78
         auckland_lat, auckland_lon = -36.85, 174.76
-        
+
         dist = haversine_distance(
             wellington_lat, wellington_lon,
             auckland_lat, auckland_lon
         )
-        
-        # Should be approximately 640 km
-        assert 600 < dist < 680
+
+        # Should be approximately 490 km
+        assert 470 < dist < 510
     
     def test_haversine_distance_equator(self):
         """Test haversine distance along equator."""
@@ -368,6 +419,32 @@ class TestMathUtilities:
         dist = haversine_distance(0, 0, 0, 1)
         assert 100 < dist < 120
 
+    def test_haversine_distance_batch_matches_scalar(self):
+        """Test batch haversine agrees with the scalar implementation."""
+        import numpy as np
+
+        lats = np.array([-36.85, -43.53, -45.87])
+        lons = np.array([174.76, 172.64, 170.50])
+
+        dists = haversine_distance_batch(-41.28, 174.78, lats, lons)
+        assert dists.shape == (3,)
+
+        for i in range(3):
+            scalar = haversine_distance(-41.28, 174.78, lats[i], lons[i])
+            assert abs(dists[i] - scalar) < 1e-9
+
+    def test_haversine_distance_array_dispatch(self):
+        """Test scalar API dispatches to the batch path for arrays."""
+        import numpy as np
+
+        lats = np.array([0.0, 0.0])
+        lons = np.array([1.0, 2.0])
+
+        dists = haversine_distance(0.0, 0.0, lats, lons)
+        assert isinstance(dists, np.ndarray)
+        assert 100 < dists[0] < 120
+        assert abs(dists[1] - 2 * dists[0]) < 1.0
+
 
 class TestIntegration:
     """Integration tests for common utilities."""
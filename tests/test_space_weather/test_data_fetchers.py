@@ -7,9 +7,13 @@ Run with: pytest tests/test_space_weather/test_data_fetchers.py -v
 
 import pytest
 from unittest.mock import patch, Mock
+from tawhiri.space_weather.constants import NOAA_URLS
 from tawhiri.space_weather.data_fetchers import (
+    _LAST_GOOD,
     fetch_json,
+    fetch_json_fast,
     fetch_text,
+    fetch_text_slow,
     parse_three_day_full,
     parse_three_day_for_next24,
     get_noaa_rsg_now_and_past,
@@ -17,14 +21,25 @@ from tawhiri.space_weather.data_fetchers import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_fetch_caches():
+    """Reset st.cache_data and the stale tier so mocked responses aren't reused."""
+    fetch_json.clear()
+    fetch_json_fast.clear()
+    fetch_text.clear()
+    fetch_text_slow.clear()
+    _LAST_GOOD.clear()
+    yield
+
+
 class TestFetchFunctions:
     """Test core fetch functions with mocked requests."""
-    
-    @patch('tawhiri.space_weather.data_fetchers.requests.get')
+
+    @patch('tawhiri.space_weather.data_fetchers._SESSION.get')
     def test_fetch_json_success(self, mock_get):
         """Test successful JSON fetch."""
         mock_response = Mock()
-        mock_response.json.return_value = {"test": "data"}
+        mock_response.content = b'{"test": "data"}'
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
         
@@ -33,7 +48,7 @@ class TestFetchFunctions:
         assert result == {"test": "data"}
         mock_get.assert_called_once()
     
-    @patch('tawhiri.space_weather.data_fetchers.requests.get')
+    @patch('tawhiri.space_weather.data_fetchers._SESSION.get')
     def test_fetch_json_failure(self, mock_get):
         """Test JSON fetch handles errors gracefully."""
         mock_get.side_effect = Exception("Network error")
@@ -42,7 +57,7 @@ class TestFetchFunctions:
         
         assert result is None
     
-    @patch('tawhiri.space_weather.data_fetchers.requests.get')
+    @patch('tawhiri.space_weather.data_fetchers._SESSION.get')
     def test_fetch_text_success(self, mock_get):
         """Test successful text fetch."""
         mock_response = Mock()
@@ -54,7 +69,7 @@ class TestFetchFunctions:
         
         assert result == "Sample text content"
     
-    @patch('tawhiri.space_weather.data_fetchers.requests.get')
+    @patch('tawhiri.space_weather.data_fetchers._SESSION.get')
     def test_fetch_text_failure(self, mock_get):
         """Test text fetch handles errors gracefully."""
         mock_get.side_effect = Exception("Network error")
@@ -141,18 +156,17 @@ class TestThreeDayParsing:
 class TestNOAARSGData:
     """Test NOAA R/S/G current and past data fetching."""
     
-    @patch('tawhiri.space_weather.data_fetchers.fetch_json')
+    @patch('tawhiri.space_weather.data_fetchers.fetch_json_fast')
     def test_get_noaa_rsg_quiet_conditions(self, mock_fetch):
         """Test getting R/S/G data during quiet conditions."""
-        # Mock quiet conditions data
-        mock_fetch.side_effect = [
-            # Kp data
-            [{"kp_index": 2.0}, {"kp_index": 2.3}, {"kp_index": 2.1}],
-            # X-ray data
-            [{"flux": 1e-7}, {"flux": 2e-7}, {"flux": 1.5e-7}],
-            # Proton data
-            [{"flux": 0.5}, {"flux": 0.8}, {"flux": 0.6}],
-        ]
+        # Mock quiet conditions data, keyed by URL since the three
+        # feeds are fetched concurrently
+        responses = {
+            NOAA_URLS['kp_3day']: [{"kp_index": 2.0}, {"kp_index": 2.3}, {"kp_index": 2.1}],
+            NOAA_URLS['xray_7day']: [{"flux": 1e-7}, {"flux": 2e-7}, {"flux": 1.5e-7}],
+            NOAA_URLS['proton_7day']: [{"flux": 0.5}, {"flux": 0.8}, {"flux": 0.6}],
+        }
+        mock_fetch.side_effect = lambda url, *args, **kwargs: responses[url]
         
         past, current = get_noaa_rsg_now_and_past()
         
@@ -164,18 +178,20 @@ class TestNOAARSGData:
         assert current["s_status"] == "No"
         assert current["g_status"] == "No"
     
-    @patch('tawhiri.space_weather.data_fetchers.fetch_json')
+    @patch('tawhiri.space_weather.data_fetchers.fetch_json_fast')
     def test_get_noaa_rsg_active_conditions(self, mock_fetch):
         """Test getting R/S/G data during active conditions."""
-        # Mock active conditions
-        mock_fetch.side_effect = [
+        # Mock active conditions, keyed by URL since the three feeds
+        # are fetched concurrently
+        responses = {
             # Kp data - geomagnetic storm
-            [{"kp_index": 6.5}, {"kp_index": 7.0}, {"kp_index": 6.8}],
+            NOAA_URLS['kp_3day']: [{"kp_index": 6.5}, {"kp_index": 7.0}, {"kp_index": 6.8}],
             # X-ray data - M-class flare
-            [{"flux": 5e-5}, {"flux": 8e-5}, {"flux": 6e-5}],
+            NOAA_URLS['xray_7day']: [{"flux": 5e-5}, {"flux": 8e-5}, {"flux": 6e-5}],
             # Proton data - elevated
-            [{"flux": 50}, {"flux": 80}, {"flux": 60}],
-        ]
+            NOAA_URLS['proton_7day']: [{"flux": 50}, {"flux": 80}, {"flux": 60}],
+        }
+        mock_fetch.side_effect = lambda url, *args, **kwargs: responses[url]
         
         past, current = get_noaa_rsg_now_and_past()
         
@@ -187,7 +203,7 @@ class TestNOAARSGData:
         assert current["s_status"] == "Active"
         assert current["g_status"] == "Active"
     
-    @patch('tawhiri.space_weather.data_fetchers.fetch_json')
+    @patch('tawhiri.space_weather.data_fetchers.fetch_json_fast')
     def test_get_noaa_rsg_handles_failures(self, mock_fetch):
         """Test that failures return safe defaults."""
         # Mock all failures
@@ -36,8 +36,8 @@ class TestTimeseriesChart:
         assert fig is not None
         assert isinstance(fig, go.Figure)
         assert len(fig.data) == 1  # One trace
-        assert fig.data[0].x == [d["time_tag"] for d in data]
-        assert fig.data[0].y == [d["flux"] for d in data]
+        assert list(fig.data[0].x) == [d["time_tag"] for d in data]
+        assert list(fig.data[0].y) == [d["flux"] for d in data]
     
     def test_empty_data_returns_none(self):
         """Test that empty data returns None."""
@@ -86,8 +86,8 @@ class TestTimeseriesChart:
         )
         
         assert fig is not None
-        assert fig.data[0].x == ["2025-01-01T00:00:00Z", "2025-01-01T01:00:00Z"]
-        assert fig.data[0].y == [10, 20]
+        assert list(fig.data[0].x) == ["2025-01-01T00:00:00Z", "2025-01-01T01:00:00Z"]
+        assert list(fig.data[0].y) == [10, 20]
     
     def test_log_scale(self):
         """Test logarithmic y-axis."""
@@ -254,7 +254,7 @@ class TestKpChart:
         assert isinstance(fig, go.Figure)
         assert "Kp" in fig.layout.title.text
         assert fig.layout.yaxis.type != "log"  # Kp is linear scale
-        assert fig.layout.yaxis.range == [0, 9]  # Kp range is 0-9
+        assert list(fig.layout.yaxis.range) == [0, 9]  # Kp range is 0-9
         
         # Check for storm threshold line
         hlines = [shape for shape in fig.layout.shapes if shape.type == 'line']